@@ -1,6 +1,6 @@
 """Interactive TUI for Fredo using prompt_toolkit."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import Completer, Completion
@@ -12,7 +12,7 @@ from pygments.util import ClassNotFound
 
 from fredo.core.database import db
 from fredo.core.models import Snippet
-from fredo.core.search import search_engine
+from fredo.core.search import SearchResult, search_engine
 
 
 class SnippetCompleter(Completer):
@@ -21,11 +21,18 @@ class SnippetCompleter(Completer):
     def __init__(self):
         """Initialize the completer."""
         self.snippets: List[Snippet] = []
+        # Search results per query, reused while typing and backspacing
+        self._results: Dict[str, List[SearchResult]] = {}
         self.refresh()
 
-    def refresh(self):
-        """Refresh the list of snippets."""
-        self.snippets = db.list_all()
+    def refresh(self, snippets: Optional[List[Snippet]] = None):
+        """Refresh the list of snippets.
+
+        Args:
+            snippets: Snapshot to complete from; defaults to every snippet
+        """
+        self.snippets = db.list_all() if snippets is None else snippets
+        self._results.clear()
 
     def get_completions(self, document: Document, complete_event):
         """Get completions based on current input."""
@@ -33,7 +40,10 @@ class SnippetCompleter(Completer):
 
         # Search snippets
         if query:
-            results = search_engine.search(query=query, limit=20)
+            results = self._results.get(query)
+            if results is None:
+                results = search_engine.rank(query, self.snippets, limit=20)
+                self._results[query] = results
         else:
             # Show all snippets if no query
             results = [type("R", (), {"snippet": s, "score": 100})() for s in self.snippets[:20]]
@@ -74,7 +84,7 @@ def fuzzy_select_snippet(
 
     # If filters are provided, pre-filter snippets
     if language or tags:
-        completer.snippets = db.search(language=language, tags=tags)
+        completer.refresh(db.search(language=language, tags=tags))
 
     try:
         # Show prompt with completer
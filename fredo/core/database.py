@@ -6,9 +6,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from fredo.core.models import Snippet
+from fredo.core.models import DB_COLUMNS, Snippet
 from fredo.utils.config import config_manager
 
+_INSERT_PREFIX = f"INSERT INTO snippets ({', '.join(DB_COLUMNS)}) VALUES "
+_ROW_PLACEHOLDERS = f"({', '.join('?' for _ in DB_COLUMNS)})"
+
+# Keep multi-row inserts under SQLite's default limit of 999 bound variables
+_BULK_CHUNK_SIZE = 999 // len(DB_COLUMNS)
+
 
 class Database:
     """Database manager for snippets."""
@@ -70,29 +76,26 @@ class Database:
         """Create a new snippet."""
         self.init_db()
         with self.get_connection() as conn:
-            data = snippet.to_db_dict()
-            conn.execute(
-                """
-                INSERT INTO snippets 
-                (id, name, content, language, tags, execution_mode, 
-                 gist_id, gist_url, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    data["id"],
-                    data["name"],
-                    data["content"],
-                    data["language"],
-                    data["tags"],
-                    data["execution_mode"],
-                    data["gist_id"],
-                    data["gist_url"],
-                    data["created_at"],
-                    data["updated_at"],
-                ),
-            )
+            conn.execute(_INSERT_PREFIX + _ROW_PLACEHOLDERS, snippet.to_db_row())
         return snippet
 
+    def bulk_create(self, snippets: List[Snippet]) -> List[Snippet]:
+        """Create several snippets in a single transaction.
+
+        Rows are merged into multi-row INSERT statements rather than
+        issuing one statement per snippet.
+        """
+        self.init_db()
+        with self.get_connection() as conn:
+            for start in range(0, len(snippets), _BULK_CHUNK_SIZE):
+                chunk = snippets[start : start + _BULK_CHUNK_SIZE]
+                params = [value for s in chunk for value in s.to_db_row()]
+                conn.execute(
+                    _INSERT_PREFIX + ", ".join([_ROW_PLACEHOLDERS] * len(chunk)),
+                    params,
+                )
+        return snippets
+
     def get_by_id(self, snippet_id: str) -> Optional[Snippet]:
         """Get a snippet by ID."""
         self.init_db()
@@ -120,7 +123,18 @@ class Database:
     def update(self, snippet: Snippet) -> Snippet:
         """Update an existing snippet."""
         snippet.updated_at = datetime.now()
-        data = snippet.to_db_dict()
+        (
+            snippet_id,
+            name,
+            content,
+            language,
+            tags,
+            execution_mode,
+            gist_id,
+            gist_url,
+            _created_at,
+            updated_at,
+        ) = snippet.to_db_row()
         with self.get_connection() as conn:
             conn.execute(
                 """
@@ -131,15 +145,15 @@ class Database:
                 WHERE id = ?
                 """,
                 (
-                    data["name"],
-                    data["content"],
-                    data["language"],
-                    data["tags"],
-                    data["execution_mode"],
-                    data["gist_id"],
-                    data["gist_url"],
-                    data["updated_at"],
-                    data["id"],
+                    name,
+                    content,
+                    language,
+                    tags,
+                    execution_mode,
+                    gist_id,
+                    gist_url,
+                    updated_at,
+                    snippet_id,
                 ),
             )
         return snippet
@@ -170,6 +184,22 @@ class Database:
             rows = cursor.fetchall()
             return [Snippet.from_db_dict(dict(row)) for row in rows]
 
+    def count(self) -> int:
+        """Count all snippets."""
+        self.init_db()
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM snippets")
+            return cursor.fetchone()[0]
+
+    def exists(self, snippet_id: str) -> bool:
+        """Check whether a snippet with the given ID exists."""
+        self.init_db()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM snippets WHERE id = ? LIMIT 1", (snippet_id,)
+            )
+            return cursor.fetchone() is not None
+
     def search(
         self,
         query: Optional[str] = None,
@@ -2,11 +2,52 @@
 
 import json
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+# Column order of the ``snippets`` table, shared with the database layer
+DB_COLUMNS = (
+    "id",
+    "name",
+    "content",
+    "language",
+    "tags",
+    "execution_mode",
+    "gist_id",
+    "gist_url",
+    "created_at",
+    "updated_at",
+)
+
+# File extension for each known language (keys are lowercase)
+_EXT_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "python": ".py",
+        "bash": ".sh",
+        "shell": ".sh",
+        "javascript": ".js",
+        "typescript": ".ts",
+        "ruby": ".rb",
+        "go": ".go",
+        "rust": ".rs",
+        "java": ".java",
+        "c": ".c",
+        "cpp": ".cpp",
+        "csharp": ".cs",
+        "php": ".php",
+        "sql": ".sql",
+        "html": ".html",
+        "css": ".css",
+        "json": ".json",
+        "yaml": ".yaml",
+        "markdown": ".md",
+    }
+)
+
 
 class Snippet(BaseModel):
     """Model for a code snippet."""
@@ -36,20 +77,24 @@ class Snippet(BaseModel):
         """Validate and clean tags."""
         return [tag.strip().lower() for tag in v if tag.strip()]
 
+    def to_db_row(self) -> tuple:
+        """Convert to a tuple of column values in ``DB_COLUMNS`` order."""
+        return (
+            self.id,
+            self.name,
+            self.content,
+            self.language,
+            json.dumps(self.tags),
+            self.execution_mode,
+            self.gist_id,
+            self.gist_url,
+            self.created_at.isoformat(),
+            self.updated_at.isoformat(),
+        )
+
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "content": self.content,
-            "language": self.language,
-            "tags": json.dumps(self.tags),
-            "execution_mode": self.execution_mode,
-            "gist_id": self.gist_id,
-            "gist_url": self.gist_url,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return dict(zip(DB_COLUMNS, self.to_db_row()))
 
     @classmethod
     def from_db_dict(cls, data: dict) -> "Snippet":
@@ -72,28 +117,7 @@ class Snippet(BaseModel):
         return get_file_extension_for_language(self.language)
 
 
+@lru_cache(maxsize=64)
 def get_file_extension_for_language(language: str) -> str:
     """Get appropriate file extension for a language."""
-    extension_map = {
-        "python": ".py",
-        "bash": ".sh",
-        "shell": ".sh",
-        "javascript": ".js",
-        "typescript": ".ts",
-        "ruby": ".rb",
-        "go": ".go",
-        "rust": ".rs",
-        "java": ".java",
-        "c": ".c",
-        "cpp": ".cpp",
-        "csharp": ".cs",
-        "php": ".php",
-        "sql": ".sql",
-        "html": ".html",
-        "css": ".css",
-        "json": ".json",
-        "yaml": ".yaml",
-        "markdown": ".md",
-    }
-    return extension_map.get(language.lower(), ".txt")
-
+    return _EXT_MAP.get(language.lower(), ".txt")
@@ -1,13 +1,14 @@
 """Snippet execution engine for Fredo."""
 
+import hashlib
 import os
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from pygments.lexers import get_lexer_by_name, guess_lexer
+from pygments.lexers import guess_lexer
 from pygments.util import ClassNotFound
 
 from fredo.core.models import Snippet
@@ -37,6 +38,11 @@ class SnippetRunner:
         "r": {"cmd": ["Rscript"], "use_file": True},
     }
 
+    def __init__(self):
+        """Initialize the runner."""
+        # Pygments guesses keyed by a digest of the snippet content
+        self._lang_cache: Dict[bytes, str] = {}
+
     def detect_language(self, snippet: Snippet) -> str:
         """Detect the language of a snippet."""
         # 1. Check if language is explicitly set (and not 'auto')
@@ -80,9 +86,18 @@ class SnippetRunner:
         ]):
             return "javascript"
 
-        # 4. Use Pygments to guess the language
+        # 4. Use Pygments to guess the language, reusing earlier guesses
+        key = hashlib.blake2b(snippet.content.encode(), digest_size=16).digest()
+        language = self._lang_cache.get(key)
+        if language is None:
+            language = self._guess_language(snippet.content)
+            self._lang_cache[key] = language
+        return language
+
+    def _guess_language(self, content: str) -> str:
+        """Guess a language from content with Pygments, defaulting to bash."""
         try:
-            lexer = guess_lexer(snippet.content)
+            lexer = guess_lexer(content)
             lang_name = lexer.name.lower()
             # Map Pygments names to our executor names
             if "python" in lang_name:
@@ -1,5 +1,6 @@
 """Fuzzy search engine for Fredo."""
 
+import heapq
 from typing import List, Optional
 
 from thefuzz import fuzz
@@ -11,6 +12,8 @@ from fredo.core.models import Snippet
 class SearchResult:
     """A search result with score."""
 
+    __slots__ = ("score", "snippet")
+
     def __init__(self, snippet: Snippet, score: int):
         """Initialize search result."""
         self.snippet = snippet
@@ -46,30 +49,57 @@ class SearchEngine:
         Returns:
             List of SearchResult objects sorted by score (descending)
         """
-        # Get snippets from database with filters
-        snippets = self.db.search(language=language, tags=tags)
-
-        # Handle limit=0 early
+        # Handle limit=0 before touching the database
         if limit is not None and limit == 0:
             return []
 
+        # Get snippets from database with filters
+        snippets = self.db.search(language=language, tags=tags)
+
         if not query:
             # No query, just return all matching filters sorted by update time
-            results = [SearchResult(s, 100) for s in snippets]
             if limit:
-                results = results[:limit]
-            return results
+                snippets = snippets[:limit]
+            return [SearchResult(s, 100) for s in snippets]
+
+        return self.rank(query, snippets, limit=limit)
+
+    def rank(
+        self,
+        query: str,
+        snippets: List[Snippet],
+        limit: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """Score already loaded snippets against a query.
+
+        Use this instead of search() to rank a snapshot the caller holds,
+        such as the interactive completer's list, without a database read.
+
+        Args:
+            query: Search query for fuzzy matching
+            snippets: Snippets to score, in tie-breaking order
+            limit: Maximum number of results to return
+
+        Returns:
+            List of SearchResult objects sorted by score (descending)
+        """
+        if limit is not None and limit == 0:
+            return []
 
         # Calculate fuzzy match scores
+        query_lower = query.lower()
         results = []
         for snippet in snippets:
-            score = self._calculate_score(query, snippet)
+            score = self._calculate_score(query_lower, snippet)
             # Only include results with meaningful scores (>= 27)
             # This filters out weak fuzzy matches that are essentially noise
             if score >= 27:
                 results.append(SearchResult(snippet, score))
 
-        # Sort by score (descending)
+        # Sort by score (descending); a small limit only needs a partial sort
+        if limit and 0 < limit < len(results) // 2:
+            return heapq.nlargest(limit, results, key=lambda r: r.score)
+
         results.sort(key=lambda r: r.score, reverse=True)
 
         if limit:
@@ -77,16 +107,18 @@ class SearchEngine:
 
         return results
 
-    def _calculate_score(self, query: str, snippet: Snippet) -> int:
+    def _calculate_score(self, query_lower: str, snippet: Snippet) -> int:
         """Calculate fuzzy match score for a snippet.
 
+        The query must already be lowercased; rank() does this once per
+        search rather than once per snippet.
+
         Scoring strategy:
         - Name exact match: 100
         - Name fuzzy match: weighted by ratio (up to 90)
         - Tag match: 70 per matching tag
         - Content match: weighted by ratio (up to 50)
         """
-        query_lower = query.lower()
         name_lower = snippet.name.lower()
 
         # Check for exact name match
@@ -103,9 +135,10 @@ class SearchEngine:
         # Check for tag matches
         tag_score = 0
         for tag in snippet.tags:
-            if query_lower in tag.lower():
+            tag_lower = tag.lower()
+            if query_lower in tag_lower:
                 tag_score += 70
-            elif fuzz.ratio(query_lower, tag.lower()) > 80:
+            elif fuzz.ratio(query_lower, tag_lower) > 80:
                 tag_score += 50
 
         # Calculate content match score
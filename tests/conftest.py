@@ -11,10 +11,12 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 from github import Github
+from github.AuthenticatedUser import AuthenticatedUser
 from github.Gist import Gist as GithubGist
 
 from fredo.core.database import Database
 from fredo.core.models import Snippet
+from fredo.core.runner import SnippetRunner
 from fredo.utils.config import ConfigManager, FredoConfig
 
 
@@ -78,6 +80,22 @@ def search_engine(db: Database):
     return SearchEngine(database=db)
 
 
+@pytest.fixture(scope="session")
+def runner() -> SnippetRunner:
+    """Create a SnippetRunner shared by the whole session.
+
+    The only state it keeps is a cache of language guesses keyed by
+    content, so one instance serves every test.
+    """
+    return SnippetRunner()
+
+
+@pytest.fixture(scope="session")
+def available_cmds() -> dict:
+    """Look up the interpreters used by the execution tests once per session."""
+    return {cmd: shutil.which(cmd) for cmd in ("python3", "bash")}
+
+
 @pytest.fixture
 def sample_snippet() -> Snippet:
     """Create a sample snippet for testing."""
@@ -93,6 +111,15 @@ def sample_snippet() -> Snippet:
     )
 
 
+@pytest.fixture(scope="module")
+def base_snippet() -> Snippet:
+    """Create a minimal snippet shared by the read-only tests of a module.
+
+    Derive variants with ``model_copy(update=...)`` instead of mutating it.
+    """
+    return Snippet(name="test", content="test")
+
+
 @pytest.fixture
 def sample_bash_snippet() -> Snippet:
     """Create a sample bash snippet for testing."""
@@ -164,9 +191,44 @@ def mock_github() -> Mock:
     return mock_gh
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def gh_mock_factory():
+    """Return a factory for mock GitHub clients.
+
+    Each call builds a fresh client specced against ``Github`` whose
+    ``get_user()`` returns ``get_user_return`` (a new AuthenticatedUser
+    mock by default); the remaining keyword arguments configure
+    ``get_user`` and ``get_gist``.
+    """
+
+    def make(
+        user_side_effect=None,
+        get_user_return=None,
+        get_gist_return=None,
+        get_gist_side_effect=None,
+    ) -> Mock:
+        config = {
+            "get_user.return_value": (
+                get_user_return or Mock(spec=AuthenticatedUser)
+            ),
+            "get_user.side_effect": user_side_effect,
+            "get_gist.side_effect": get_gist_side_effect,
+        }
+        if get_gist_return is not None:
+            config["get_gist.return_value"] = get_gist_return
+        mock_gh = Mock(spec=Github)
+        mock_gh.configure_mock(**config)
+        return mock_gh
+
+    return make
+
+
+@pytest.fixture(scope="module")
 def mock_gist() -> Mock:
-    """Create a mock GitHub Gist."""
+    """Create a mock GitHub Gist.
+
+    Module-scoped: tests only read from it, so build it once per module.
+    """
     mock_gist = Mock(spec=GithubGist)
     mock_gist.id = "test_gist_id_123"
     mock_gist.html_url = "https://gist.github.com/testuser/test_gist_id_123"
@@ -217,6 +279,16 @@ def reset_global_instances():
     gist.gist_manager._github = None
 
 
+@pytest.fixture
+def read_text(monkeypatch):
+    """Return a setter that makes Path.read_text return the given value."""
+
+    def _set(value: str):
+        monkeypatch.setattr(Path, "read_text", lambda self, *a, **kw: value)
+
+    return _set
+
+
 @pytest.fixture
 def mock_subprocess_success():
     """Mock subprocess.run for successful execution."""
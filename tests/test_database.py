@@ -1,6 +1,7 @@
 """Tests for the Database operations."""
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +11,26 @@ from fredo.core.database import Database
 from fredo.core.models import Snippet
 
 
+@contextmanager
+def sql_budget(db: Database, max_stmts: int):
+    """Assert that the block issues at most ``max_stmts`` SQL statements."""
+    statements = []
+    get_connection = db.get_connection
+
+    @contextmanager
+    def traced_connection():
+        with get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            yield conn
+
+    db.get_connection = traced_connection
+    try:
+        yield statements
+    finally:
+        del db.get_connection
+    assert len(statements) <= max_stmts, statements
+
+
 class TestDatabaseInitialization:
     """Test database initialization."""
 
@@ -134,8 +155,40 @@ class TestDatabaseCreate:
         for snippet in multiple_snippets:
             db.create(snippet)
         
-        all_snippets = db.list_all()
-        assert len(all_snippets) == len(multiple_snippets)
+        assert db.count() == len(multiple_snippets)
+
+
+class TestDatabaseBulkCreate:
+    """Test creating snippets in bulk."""
+
+    def test_bulk_create_persists_all(self, db: Database, multiple_snippets):
+        """Test that bulk_create stores every snippet."""
+        result = db.bulk_create(multiple_snippets)
+        
+        assert result == multiple_snippets
+        assert db.count() == len(multiple_snippets)
+        assert db.get_by_name("docker-cleanup").tags == ["docker", "cleanup"]
+
+    def test_bulk_create_empty_list(self, db: Database):
+        """Test that bulk_create with no snippets is a no-op."""
+        assert db.bulk_create([]) == []
+        assert db.count() == 0
+
+    def test_bulk_create_more_than_one_chunk(self, db: Database):
+        """Test bulk_create with more rows than fit in one statement."""
+        snippets = [Snippet(name=f"s{i}", content="test") for i in range(250)]
+        
+        db.bulk_create(snippets)
+        
+        assert db.count() == 250
+
+    def test_bulk_create_single_statement(self, db: Database, multiple_snippets):
+        """Test that bulk_create does not issue one INSERT per snippet."""
+        with sql_budget(db, 6) as statements:
+            db.bulk_create(multiple_snippets)
+        
+        inserts = [s for s in statements if s.lstrip().startswith("INSERT")]
+        assert len(inserts) == 1
 
 
 class TestDatabaseRead:
@@ -183,8 +236,8 @@ class TestDatabaseRead:
 
     def test_list_all_empty_database(self, db: Database):
         """Test listing all snippets in empty database."""
-        result = db.list_all()
-        assert result == []
+        assert db.count() == 0
+        assert db.list_all() == []
 
     def test_list_all_returns_all_snippets(self, db: Database, multiple_snippets):
         """Test that list_all returns all snippets."""
@@ -194,7 +247,7 @@ class TestDatabaseRead:
         result = db.list_all()
         
         assert len(result) == len(multiple_snippets)
-        result_names = [s.name for s in result]
+        result_names = {s.name for s in result}
         for snippet in multiple_snippets:
             assert snippet.name in result_names
 
@@ -336,12 +389,35 @@ class TestDatabaseDelete:
         db.delete(sample_snippet.id)
         
         # Try to get it again
-        result = db.get_by_id(sample_snippet.id)
-        assert result is None
+        assert not db.exists(sample_snippet.id)
         
-        # List all should not include it
-        all_snippets = db.list_all()
-        assert len(all_snippets) == 0
+        # Table should be empty
+        assert db.count() == 0
+
+
+class TestDatabaseCount:
+    """Test counting and existence probes."""
+
+    def test_count_empty_database(self, db: Database):
+        """Test counting snippets in empty database."""
+        assert db.count() == 0
+
+    def test_count_after_create(self, db: Database, multiple_snippets):
+        """Test that count reflects created snippets."""
+        for snippet in multiple_snippets:
+            db.create(snippet)
+        
+        assert db.count() == len(multiple_snippets)
+
+    def test_exists_existing_snippet(self, db: Database, sample_snippet: Snippet):
+        """Test exists returns True for a stored snippet."""
+        db.create(sample_snippet)
+        
+        assert db.exists(sample_snippet.id) is True
+
+    def test_exists_nonexistent_snippet(self, db: Database):
+        """Test exists returns False for an unknown ID."""
+        assert db.exists("nonexistent-id") is False
 
 
 class TestDatabaseSearch:
@@ -364,7 +440,7 @@ class TestDatabaseSearch:
         result = db.search(query="python")
         
         assert len(result) == 2
-        result_names = [s.name for s in result]
+        result_names = {s.name for s in result}
         assert "python-hello" in result_names
         assert "python-calc" in result_names
 
@@ -406,7 +482,7 @@ class TestDatabaseSearch:
         result = db.search(tags=["hello"])
         
         assert len(result) == 2
-        result_names = [s.name for s in result]
+        result_names = {s.name for s in result}
         assert "python-hello" in result_names
         assert "bash-script" in result_names
 
@@ -419,7 +495,7 @@ class TestDatabaseSearch:
         
         # Should match snippets with docker OR api
         assert len(result) == 2
-        result_names = [s.name for s in result]
+        result_names = {s.name for s in result}
         assert "docker-cleanup" in result_names
         assert "js-fetch" in result_names
 
@@ -1,30 +1,135 @@
 """Tests for the EditorManager."""
 
-import tempfile
+import io
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
 
 import pytest
 
-from fredo.utils.editor import EditorError, EditorManager
+from fredo.utils.editor import EditorError, EditorManager, editor_manager
+
+pytestmark = pytest.mark.xdist_group(name="editor_tests")
+
+
+def _assert_edited(result, *, has=(), missing=(), newline=False):
+    """Assert on the text returned by edit_content."""
+    assert result is not None
+    assert [text for text in has if text not in result] == []
+    assert [text for text in missing if text in result] == []
+    if newline:
+        assert result.endswith("\n")
+
+
+_real_get_editor = EditorManager.get_editor
+
+LONG_CONTENT = "x" * 100_000
+
+# Shared result for hand-written subprocess.run side effects
+_OK = SimpleNamespace(returncode=0)
+
+COMMENT_CHARS = {
+    ".py": "#",
+    ".sh": "#",
+    ".bash": "#",
+    ".rb": "#",
+    ".r": "#",
+    ".yaml": "#",
+    ".yml": "#",
+    ".toml": "#",
+    ".js": "//",
+    ".ts": "//",
+    ".java": "//",
+    ".c": "//",
+    ".cpp": "//",
+    ".cs": "//",
+    ".go": "//",
+    ".rs": "//",
+    ".php": "//",
+    ".sql": "--",
+    ".lua": "--",
+    ".html": "<!--",
+    ".css": "/*",
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fast_editor():
+    """Skip the config lookup behind get_editor for the whole module.
+
+    Tests that verify get_editor itself restore the real method.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(EditorManager, "get_editor", lambda self: "vim")
+        yield
+
+
+@pytest.fixture(scope="module")
+def em() -> EditorManager:
+    """Share one EditorManager across the module; tests do not mutate it."""
+    return EditorManager()
+
+
+class _FakeTempFile(io.StringIO):
+    """In-memory stand-in for the file returned by NamedTemporaryFile."""
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+
+@pytest.fixture
+def fake_tempfile(monkeypatch):
+    """Keep edit_content's temporary file in memory instead of on disk."""
+
+    def fake_named_temporary_file(*args, suffix: str = "", **kwargs):
+        return _FakeTempFile(f"/tmp/fredo-fake-{uuid4().hex}{suffix}")
+
+    monkeypatch.setattr("tempfile.NamedTemporaryFile", fake_named_temporary_file)
+    monkeypatch.setattr(Path, "unlink", lambda self, *args, **kwargs: None)
+
+
+@pytest.fixture
+def editor_env(monkeypatch, read_text, fake_tempfile):
+    """Stub both the editor subprocess and the edited file contents.
+
+    ``setup(rc, text)`` makes subprocess.run return ``rc`` and
+    Path.read_text return ``text``; commands run are recorded in ``calls``.
+    """
+    calls = []
+
+    def setup(rc: int = 0, text: str = "content") -> list:
+        result = _OK if rc == 0 else SimpleNamespace(returncode=rc)
+
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            return result
+
+        monkeypatch.setattr("subprocess.run", fake_run)
+        read_text(text)
+        return calls
+
+    return SimpleNamespace(setup=setup, calls=calls)
 
 
 class TestEditorManagerGetEditor:
     """Test getting editor command."""
 
-    def test_get_editor_from_config(self, config_manager):
+    @pytest.fixture(autouse=True)
+    def _real_editor(self, monkeypatch):
+        """Use the real get_editor in this class."""
+        monkeypatch.setattr(EditorManager, "get_editor", _real_get_editor)
+
+    def test_get_editor_from_config(self, em, config_manager):
         """Test getting editor from configuration."""
-        em = EditorManager()
-        
         with patch("fredo.utils.editor.config_manager", config_manager):
             editor = em.get_editor()
         
         assert editor == "vim"
 
-    def test_get_editor_uses_config_manager(self):
+    def test_get_editor_uses_config_manager(self, em):
         """Test that get_editor uses config_manager."""
-        em = EditorManager()
-        
         mock_config_manager = Mock()
         mock_config_manager.get_editor.return_value = "emacs"
         
@@ -38,183 +143,115 @@ class TestEditorManagerGetEditor:
 class TestEditorManagerEditContent:
     """Test editing content."""
 
-    def test_edit_content_creates_temp_file(self):
+    def test_edit_content_creates_temp_file(self, em, editor_env):
         """Test that edit_content creates temporary file."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value="new content"):
-                result = em.edit_content(content="initial", extension=".py")
+        editor_env.setup(text="new content")
+        result = em.edit_content(content="initial", extension=".py")
         
         assert result == "new content\n"
 
-    def test_edit_content_with_initial_content(self):
+    def test_edit_content_with_initial_content(self, em, editor_env):
         """Test editing with initial content."""
-        em = EditorManager()
-        
         initial_content = "print('hello')"
         edited_content = "print('world')"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(content=initial_content, extension=".py")
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(content=initial_content, extension=".py")
         
-        assert edited_content in result
+        _assert_edited(result, has=(edited_content,))
 
-    def test_edit_content_with_message(self):
+    def test_edit_content_with_message(self, em, editor_env):
         """Test editing with message header."""
-        em = EditorManager()
-        
         edited_content = "# Message line\n# Delete line\n\nactual content"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(
-                    content="",
-                    extension=".py",
-                    message="Message line",
-                )
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(
+            content="",
+            extension=".py",
+            message="Message line",
+        )
         
         # Message lines should be removed
-        assert "Message line" not in result
-        assert "actual content" in result
+        _assert_edited(result, has=("actual content",), missing=("Message line",))
 
-    def test_edit_content_adds_trailing_newline(self):
+    def test_edit_content_adds_trailing_newline(self, em, editor_env):
         """Test that edit_content adds trailing newline."""
-        em = EditorManager()
-        
         edited_content = "content without newline"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(content="", extension=".txt")
         
-        assert result.endswith("\n")
+        _assert_edited(result, newline=True)
 
-    def test_edit_content_returns_none_for_empty_content(self):
+    def test_edit_content_returns_none_for_empty_content(self, em, editor_env):
         """Test that empty content returns None."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value="   \n  \n"):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text="   \n  \n")
+        result = em.edit_content(content="", extension=".txt")
         
         assert result is None
 
-    def test_edit_content_returns_none_for_whitespace_only(self):
+    def test_edit_content_returns_none_for_whitespace_only(self, em, editor_env):
         """Test that whitespace-only content returns None."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=""):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text="")
+        result = em.edit_content(content="", extension=".txt")
         
         assert result is None
 
-    def test_edit_content_with_different_extensions(self):
+    @pytest.mark.parametrize("ext", [".py", ".sh", ".js", ".md", ".txt"])
+    def test_edit_content_with_different_extensions(self, em, editor_env, ext):
         """Test editing with different file extensions."""
-        em = EditorManager()
-        
-        extensions = [".py", ".sh", ".js", ".md", ".txt"]
-        
-        for ext in extensions:
-            mock_subprocess = MagicMock()
-            mock_subprocess.returncode = 0
-            
-            with patch("subprocess.run", return_value=mock_subprocess) as mock_run:
-                with patch.object(Path, "read_text", return_value="content"):
-                    em.edit_content(content="test", extension=ext)
-                
-                # Verify temp file had correct extension
-                call_args = mock_run.call_args
-                temp_file_path = call_args[0][0][1]
-                assert temp_file_path.endswith(ext)
-
-    def test_edit_content_calls_subprocess_with_editor(self):
-        """Test that subprocess is called with editor command."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
+        editor_env.setup(text="content")
+        em.edit_content(content="test", extension=ext)
         
-        with patch("subprocess.run", return_value=mock_subprocess) as mock_run:
-            with patch.object(Path, "read_text", return_value="content"):
-                with patch.object(em, "get_editor", return_value="nvim"):
-                    em.edit_content(content="test", extension=".txt")
+        # Verify temp file had correct extension
+        temp_file_path = editor_env.calls[-1][1]
+        assert temp_file_path.endswith(ext)
+
+    def test_edit_content_calls_subprocess_with_editor(self, em, editor_env):
+        """Test that subprocess is called with editor command."""
+        editor_env.setup(text="content")
+        with patch.object(em, "get_editor", return_value="nvim"):
+            em.edit_content(content="test", extension=".txt")
         
         # Verify subprocess was called with nvim
-        call_args = mock_run.call_args[0][0]
+        call_args = editor_env.calls[-1]
         assert call_args[0] == "nvim"
 
-    def test_edit_content_handles_editor_nonzero_exit(self):
+    def test_edit_content_handles_editor_nonzero_exit(self, em, editor_env):
         """Test handling editor non-zero exit code."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 1  # Non-zero exit
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value="content"):
-                # Should still return content (some editors exit non-zero)
-                result = em.edit_content(content="test", extension=".txt")
+        editor_env.setup(rc=1, text="content")
+        # Should still return content (some editors exit non-zero)
+        result = em.edit_content(content="test", extension=".txt")
         
         assert result is not None
 
-    def test_edit_content_cleans_up_temp_file(self):
+    def test_edit_content_cleans_up_temp_file(self, em, read_text):
         """Test that temporary file is cleaned up."""
-        em = EditorManager()
-        
         temp_file_path = None
         
         def mock_run(cmd, **kwargs):
             # Track the temp file path from subprocess call
             nonlocal temp_file_path
             temp_file_path = cmd[1]
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK
         
+        read_text("content")
         with patch("subprocess.run", side_effect=mock_run):
-            with patch.object(Path, "read_text", return_value="content"):
-                em.edit_content(content="test", extension=".txt")
+            em.edit_content(content="test", extension=".txt")
         
         # Verify temp file was created and cleaned up
         assert temp_file_path is not None
         # The file should have been deleted in the finally block
-        # We can't verify deletion with mocked read_text, but no exception occurred
+        assert not Path(temp_file_path).exists()
 
-    def test_edit_content_raises_editor_error_on_exception(self):
+    def test_edit_content_raises_editor_error_on_exception(self, em):
         """Test that EditorError is raised on exception."""
-        em = EditorManager()
-        
         with patch("subprocess.run", side_effect=Exception("Editor failed")):
-            with pytest.raises(EditorError) as exc_info:
+            with pytest.raises(EditorError, match="Failed to open editor"):
                 em.edit_content(content="test", extension=".txt")
-        
-        assert "Failed to open editor" in str(exc_info.value)
 
-    def test_edit_content_removes_message_comment_lines(self):
+    def test_edit_content_removes_message_comment_lines(self, em, editor_env):
         """Test that message comment lines are removed."""
-        em = EditorManager()
-        
         # Content with message comments at top
         edited_content = """# This is a message
 # Delete these lines when done.
@@ -222,39 +259,30 @@ class TestEditorManagerEditContent:
 actual content here
 more content"""
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(
-                    content="",
-                    extension=".py",
-                    message="This is a message",
-                )
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(
+            content="",
+            extension=".py",
+            message="This is a message",
+        )
         
-        assert "This is a message" not in result
-        assert "actual content here" in result
+        _assert_edited(
+            result, has=("actual content here",), missing=("This is a message",)
+        )
 
-    def test_edit_content_removes_empty_lines_after_message(self):
+    def test_edit_content_removes_empty_lines_after_message(self, em, editor_env):
         """Test that empty lines after message are removed."""
-        em = EditorManager()
-        
         edited_content = """# Message
 
 
 actual content"""
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(
-                    content="",
-                    extension=".py",
-                    message="Message",
-                )
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(
+            content="",
+            extension=".py",
+            message="Message",
+        )
         
         # Should start with actual content
         assert result.strip().startswith("actual content")
@@ -263,74 +291,36 @@ actual content"""
 class TestEditorManagerGetCommentChar:
     """Test getting comment character for extensions."""
 
-    def test_get_comment_char_python(self):
-        """Test getting comment char for Python."""
-        em = EditorManager()
-        assert em._get_comment_char(".py") == "#"
-
-    def test_get_comment_char_bash(self):
-        """Test getting comment char for bash."""
-        em = EditorManager()
-        assert em._get_comment_char(".sh") == "#"
-        assert em._get_comment_char(".bash") == "#"
-
-    def test_get_comment_char_javascript(self):
-        """Test getting comment char for JavaScript."""
-        em = EditorManager()
-        assert em._get_comment_char(".js") == "//"
-        assert em._get_comment_char(".ts") == "//"
-
-    def test_get_comment_char_ruby(self):
-        """Test getting comment char for Ruby."""
-        em = EditorManager()
-        assert em._get_comment_char(".rb") == "#"
-
-    def test_get_comment_char_sql(self):
-        """Test getting comment char for SQL."""
-        em = EditorManager()
-        assert em._get_comment_char(".sql") == "--"
-
-    def test_get_comment_char_lua(self):
-        """Test getting comment char for Lua."""
-        em = EditorManager()
-        assert em._get_comment_char(".lua") == "--"
-
-    def test_get_comment_char_html(self):
-        """Test getting comment char for HTML."""
-        em = EditorManager()
-        assert em._get_comment_char(".html") == "<!--"
-
-    def test_get_comment_char_css(self):
-        """Test getting comment char for CSS."""
-        em = EditorManager()
-        assert em._get_comment_char(".css") == "/*"
-
-    def test_get_comment_char_case_insensitive(self):
-        """Test that comment char detection is case-insensitive."""
-        em = EditorManager()
-        assert em._get_comment_char(".PY") == "#"
-        assert em._get_comment_char(".JS") == "//"
-
-    def test_get_comment_char_unknown_defaults_to_hash(self):
-        """Test that unknown extensions default to #."""
-        em = EditorManager()
-        assert em._get_comment_char(".unknown") == "#"
-        assert em._get_comment_char(".xyz") == "#"
-
-    def test_get_comment_char_all_supported_extensions(self):
-        """Test all supported extensions have comment chars."""
-        em = EditorManager()
-        
-        extensions = [
-            ".py", ".sh", ".bash", ".rb", ".r", ".yaml", ".yml", ".toml",
-            ".js", ".ts", ".java", ".c", ".cpp", ".cs", ".go", ".rs", ".php",
-            ".sql", ".lua", ".html", ".css",
-        ]
-        
-        for ext in extensions:
-            comment_char = em._get_comment_char(ext)
-            assert comment_char is not None
-            assert len(comment_char) > 0
+    @pytest.mark.parametrize(
+        "ext,expected",
+        [
+            (".py", "#"),
+            (".sh", "#"),
+            (".bash", "#"),
+            (".js", "//"),
+            (".ts", "//"),
+            (".rb", "#"),
+            (".sql", "--"),
+            (".lua", "--"),
+            (".html", "<!--"),
+            (".css", "/*"),
+            # Case-insensitive
+            (".PY", "#"),
+            (".JS", "//"),
+            # Unknown extensions default to #
+            (".unknown", "#"),
+            (".xyz", "#"),
+        ],
+    )
+    def test_get_comment_char(self, em, ext, expected):
+        """Test getting comment char for an extension."""
+        assert em._get_comment_char(ext) == expected
+
+    def test_get_comment_char_all_supported_extensions(self, em):
+        """Test all supported extensions map to their comment chars."""
+        assert {ext: em._get_comment_char(ext) for ext in COMMENT_CHARS} == (
+            COMMENT_CHARS
+        )
 
 
 class TestEditorManagerIntegration:
@@ -340,204 +330,138 @@ class TestEditorManagerIntegration:
         not Path("/usr/bin/vim").exists() and not Path("/bin/vim").exists(),
         reason="vim not available",
     )
-    def test_edit_content_with_real_editor_simulation(self):
+    def test_edit_content_with_real_editor_simulation(self, em):
         """Test edit_content with simulated real editor."""
-        em = EditorManager()
-        
         # Simulate editor modifying file
         def mock_editor_run(cmd, **kwargs):
             # Write to the file that was opened
             temp_file = Path(cmd[1])
             temp_file.write_text("edited content")
-            
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK
         
         with patch("subprocess.run", side_effect=mock_editor_run):
             result = em.edit_content(content="initial", extension=".txt")
         
-        assert "edited content" in result
+        _assert_edited(result, has=("edited content",))
 
-    def test_edit_content_preserves_unicode(self):
+    def test_edit_content_preserves_unicode(self, em, editor_env):
         """Test that edit_content preserves Unicode."""
-        em = EditorManager()
-        
         unicode_content = "Hello 世界 🌍"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
+        editor_env.setup(text=unicode_content)
+        result = em.edit_content(content="", extension=".txt")
         
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=unicode_content):
-                result = em.edit_content(content="", extension=".txt")
-        
-        assert "世界" in result
-        assert "🌍" in result
+        _assert_edited(result, has=("世界", "🌍"))
 
-    def test_edit_content_with_very_long_content(self):
+    def test_edit_content_with_very_long_content(self, em, editor_env):
         """Test editing very long content."""
-        em = EditorManager()
-        
-        long_content = "x" * 100000
+        editor_env.setup(text=LONG_CONTENT)
+        result = em.edit_content(content=LONG_CONTENT, extension=".txt")
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=long_content):
-                result = em.edit_content(content=long_content, extension=".txt")
-        
-        assert len(result) >= 100000
+        assert result == LONG_CONTENT + "\n"
 
 
 class TestEditorManagerEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_edit_content_with_empty_initial_content(self):
+    def test_edit_content_with_empty_initial_content(self, em, editor_env):
         """Test editing with empty initial content."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value="new content"):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text="new content")
+        result = em.edit_content(content="", extension=".txt")
         
         assert result == "new content\n"
 
-    def test_edit_content_with_special_characters(self):
+    def test_edit_content_with_special_characters(self, em, editor_env):
         """Test editing content with special characters."""
-        em = EditorManager()
-        
         special_content = "Special: $VAR & < > | ' \" \\"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=special_content):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text=special_content)
+        result = em.edit_content(content="", extension=".txt")
         
-        assert "$VAR" in result
+        _assert_edited(result, has=("$VAR",))
 
-    def test_edit_content_with_null_bytes(self):
+    def test_edit_content_with_null_bytes(self, em, editor_env):
         """Test editing content with null bytes."""
-        em = EditorManager()
-        
         content_with_null = "content\x00with\x00nulls"
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=content_with_null):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text=content_with_null)
+        result = em.edit_content(content="", extension=".txt")
         
-        assert "\x00" in result
+        _assert_edited(result, has=("\x00",))
 
-    def test_edit_content_with_only_newlines(self):
+    def test_edit_content_with_only_newlines(self, em, editor_env):
         """Test that content with only newlines returns None."""
-        em = EditorManager()
-        
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value="\n\n\n"):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text="\n\n\n")
+        result = em.edit_content(content="", extension=".txt")
         
         assert result is None
 
-    def test_edit_content_with_message_but_no_content(self):
+    def test_edit_content_with_message_but_no_content(self, em, editor_env):
         """Test editing with message but user provides no content."""
-        em = EditorManager()
-        
         # User deletes message but adds nothing
         edited_content = ""
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=edited_content):
-                result = em.edit_content(
-                    content="",
-                    extension=".py",
-                    message="Add your code here",
-                )
+        editor_env.setup(text=edited_content)
+        result = em.edit_content(
+            content="",
+            extension=".py",
+            message="Add your code here",
+        )
         
         assert result is None
 
-    def test_edit_content_with_multiline_message(self):
+    def test_edit_content_with_multiline_message(self, em, editor_env):
         """Test editing with multiline content."""
-        em = EditorManager()
-        
         multiline = """line 1
 line 2
 line 3"""
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=multiline):
-                result = em.edit_content(content="", extension=".txt")
+        editor_env.setup(text=multiline)
+        result = em.edit_content(content="", extension=".txt")
         
-        assert "line 1" in result
-        assert "line 2" in result
-        assert "line 3" in result
+        _assert_edited(result, has=("line 1", "line 2", "line 3"))
 
-    def test_edit_content_preserves_indentation(self):
+    def test_edit_content_preserves_indentation(self, em, editor_env):
         """Test that indentation is preserved."""
-        em = EditorManager()
-        
         indented_content = """def hello():
     print("hello")
     if True:
         print("world")"""
         
-        mock_subprocess = MagicMock()
-        mock_subprocess.returncode = 0
-        
-        with patch("subprocess.run", return_value=mock_subprocess):
-            with patch.object(Path, "read_text", return_value=indented_content):
-                result = em.edit_content(content="", extension=".py")
+        editor_env.setup(text=indented_content)
+        result = em.edit_content(content="", extension=".py")
         
-        assert "    print" in result
+        _assert_edited(result, has=("    print",))
 
-    def test_editor_error_contains_useful_info(self):
+    def test_editor_error_contains_useful_info(self, em):
         """Test that EditorError contains useful information."""
-        em = EditorManager()
-        
         with patch("subprocess.run", side_effect=OSError("No such file")):
-            with pytest.raises(EditorError) as exc_info:
+            with pytest.raises(EditorError, match="Failed to open editor"):
                 em.edit_content(content="test", extension=".txt")
-        
-        error_msg = str(exc_info.value)
-        assert "Failed to open editor" in error_msg
 
 
 class TestEditorManagerGlobalInstance:
     """Test the global editor manager instance."""
 
+    @pytest.fixture(autouse=True)
+    def _stub_config_editor(self, monkeypatch):
+        """Use the real get_editor backed by a stubbed config lookup."""
+        monkeypatch.setattr(EditorManager, "get_editor", _real_get_editor)
+        monkeypatch.setattr(
+            "fredo.utils.config.config_manager.get_editor", lambda: "vim"
+        )
+
     def test_global_editor_manager_exists(self):
         """Test that global editor manager exists."""
-        from fredo.utils.editor import editor_manager
-        
         assert editor_manager is not None
         assert isinstance(editor_manager, EditorManager)
 
     def test_global_editor_manager_is_functional(self):
         """Test that global editor manager works."""
-        from fredo.utils.editor import editor_manager
-        
         # Should be able to get editor
         editor = editor_manager.get_editor()
         
-        assert editor is not None
-        assert isinstance(editor, str)
+        assert editor == "vim"
 
 
 class TestEditorErrorException:
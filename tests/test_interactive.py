@@ -0,0 +1,92 @@
+"""Tests for the interactive snippet completer."""
+
+import pytest
+from prompt_toolkit.document import Document
+
+from fredo.cli import interactive
+from fredo.cli.interactive import SnippetCompleter
+from fredo.core.database import Database
+from fredo.core.models import Snippet
+
+
+@pytest.fixture
+def completer_db(monkeypatch, db: Database, multiple_snippets: list[Snippet]):
+    """Point the interactive module at a populated test database."""
+    for snippet in multiple_snippets:
+        db.create(snippet)
+    monkeypatch.setattr(interactive, "db", db)
+    return db
+
+
+@pytest.fixture
+def rank_calls(monkeypatch) -> list:
+    """Record the queries passed to search_engine.rank."""
+    calls = []
+    rank = interactive.search_engine.rank
+
+    def counting_rank(query, snippets, limit=None):
+        calls.append(query)
+        return rank(query, snippets, limit=limit)
+
+    monkeypatch.setattr(interactive.search_engine, "rank", counting_rank)
+    return calls
+
+
+def _complete(completer: SnippetCompleter, query: str) -> list:
+    """Return the completion texts for ``query``."""
+    return [c.text for c in completer.get_completions(Document(query), None)]
+
+
+class TestSnippetCompleterCache:
+    """Test per-query result caching in SnippetCompleter."""
+
+    def test_repeated_query_reuses_results(self, completer_db, rank_calls):
+        """Test that completing the same query twice ranks only once."""
+        completer = SnippetCompleter()
+        
+        first = _complete(completer, "python")
+        second = _complete(completer, "python")
+        
+        assert first == second
+        assert "python-hello" in first
+        assert rank_calls == ["python"]
+
+    def test_refresh_invalidates_results(self, completer_db, rank_calls):
+        """Test that refreshing the snapshot drops cached results."""
+        completer = SnippetCompleter()
+        _complete(completer, "python")
+        
+        completer.refresh()
+        _complete(completer, "python")
+        
+        assert rank_calls == ["python", "python"]
+
+    def test_refresh_with_snapshot_replaces_snippets(self, completer_db, rank_calls):
+        """Test that refreshing with a snapshot uses it and drops cached results."""
+        completer = SnippetCompleter()
+        assert "python-hello" in _complete(completer, "hello")
+        
+        completer.refresh(completer_db.search(language="bash"))
+        
+        assert _complete(completer, "hello") == ["bash-script"]
+        assert rank_calls == ["hello", "hello"]
+
+
+class TestSnippetCompleterFilter:
+    """Test completing from a filtered snapshot."""
+
+    @pytest.mark.parametrize(
+        "query", ["hello", "python", ""], ids=["match", "other", "empty"]
+    )
+    def test_completions_come_from_filtered_snapshot(self, completer_db, query):
+        """Test that only snippets in the filtered snapshot are completed."""
+        completer = SnippetCompleter()
+        filtered = completer_db.search(tags=["hello"])
+        completer.refresh(filtered)
+        
+        names = _complete(completer, query)
+        
+        assert names
+        assert set(names) <= {s.name for s in filtered}
+        assert "python-calc" not in names
+        assert "docker-cleanup" not in names
@@ -8,6 +8,39 @@ from pydantic import ValidationError
 
 from fredo.core.models import Snippet
 
+pytestmark = pytest.mark.xdist_group(name="models_tests")
+
+_CREATED = datetime(2024, 1, 1, 12, 0, 0)
+_UPDATED = datetime(2024, 1, 2, 12, 0, 0)
+_CREATED_ISO = _CREATED.isoformat()
+_UPDATED_ISO = _UPDATED.isoformat()
+
+# A database row as stored by Database.create
+_BASE_DB_DICT = {
+    "id": "test-id",
+    "name": "test-snippet",
+    "content": "print('hello')",
+    "language": "python",
+    "tags": '["test", "example"]',
+    "execution_mode": "isolated",
+    "gist_id": "gist123",
+    "gist_url": "https://gist.github.com/user/gist123",
+    "created_at": _CREATED_ISO,
+    "updated_at": _UPDATED_ISO,
+}
+
+
+@pytest.fixture(scope="module")
+def name_255() -> str:
+    """A name at the maximum allowed length."""
+    return "a" * 255
+
+
+@pytest.fixture(scope="module")
+def long_content() -> str:
+    """100,000 characters of snippet content."""
+    return "x" * 100000
+
 
 class TestSnippetCreation:
     """Test snippet creation and validation."""
@@ -30,9 +63,6 @@ class TestSnippetCreation:
 
     def test_create_snippet_with_all_fields(self):
         """Test creating a snippet with all fields."""
-        created = datetime(2024, 1, 1, 12, 0, 0)
-        updated = datetime(2024, 1, 2, 12, 0, 0)
-        
         snippet = Snippet(
             id="custom-id",
             name="full-snippet",
@@ -42,8 +72,8 @@ class TestSnippetCreation:
             execution_mode="isolated",
             gist_id="gist123",
             gist_url="https://gist.github.com/user/gist123",
-            created_at=created,
-            updated_at=updated,
+            created_at=_CREATED,
+            updated_at=_UPDATED,
         )
         
         assert snippet.id == "custom-id"
@@ -54,13 +84,14 @@ class TestSnippetCreation:
         assert snippet.execution_mode == "isolated"
         assert snippet.gist_id == "gist123"
         assert snippet.gist_url == "https://gist.github.com/user/gist123"
-        assert snippet.created_at == created
-        assert snippet.updated_at == updated
+        assert snippet.created_at == _CREATED
+        assert snippet.updated_at == _UPDATED
 
     def test_snippet_generates_unique_ids(self):
         """Test that snippets generate unique IDs."""
-        snippet1 = Snippet(name="test1", content="content1")
-        snippet2 = Snippet(name="test2", content="content2")
+        # model_construct still runs the id default factory
+        snippet1 = Snippet.model_construct(name="test1", content="content1")
+        snippet2 = Snippet.model_construct(name="test2", content="content2")
         
         assert snippet1.id != snippet2.id
         assert len(snippet1.id) > 0
@@ -70,51 +101,40 @@ class TestSnippetCreation:
 class TestSnippetValidation:
     """Test snippet validation."""
 
-    def test_empty_name_raises_error(self):
-        """Test that empty name raises validation error."""
-        with pytest.raises(ValidationError) as exc_info:
-            Snippet(name="", content="test")
-        
-        assert "name" in str(exc_info.value)
-
-    def test_missing_name_raises_error(self):
-        """Test that missing name raises validation error."""
-        with pytest.raises(ValidationError):
-            Snippet(content="test")
-
-    def test_empty_content_raises_error(self):
-        """Test that empty content raises validation error."""
+    @pytest.mark.parametrize(
+        "kwargs, loc",
+        [
+            ({"name": "", "content": "test"}, "name"),
+            ({"content": "test"}, "name"),
+            ({"name": "test", "content": ""}, "content"),
+            ({"name": "test"}, "content"),
+            ({"name": "a" * 256, "content": "test"}, "name"),
+            (
+                {"name": "test", "content": "test", "execution_mode": "invalid"},
+                "execution_mode",
+            ),
+        ],
+        ids=[
+            "empty_name",
+            "missing_name",
+            "empty_content",
+            "missing_content",
+            "long_name",
+            "bad_mode",
+        ],
+    )
+    def test_invalid_fields_raise_error(self, kwargs, loc):
+        """Test that invalid or missing fields raise validation errors."""
         with pytest.raises(ValidationError) as exc_info:
-            Snippet(name="test", content="")
+            Snippet(**kwargs)
         
-        assert "content" in str(exc_info.value)
+        assert loc in {err["loc"][0] for err in exc_info.value.errors()}
 
-    def test_missing_content_raises_error(self):
-        """Test that missing content raises validation error."""
-        with pytest.raises(ValidationError):
-            Snippet(name="test")
-
-    def test_very_long_name_raises_error(self):
-        """Test that names longer than 255 characters raise error."""
-        long_name = "a" * 256
-        with pytest.raises(ValidationError) as exc_info:
-            Snippet(name=long_name, content="test")
-        
-        assert "name" in str(exc_info.value)
-
-    def test_name_exactly_255_chars_is_valid(self):
+    def test_name_exactly_255_chars_is_valid(self, name_255):
         """Test that names exactly 255 characters are valid."""
-        name_255 = "a" * 255
         snippet = Snippet(name=name_255, content="test")
         assert snippet.name == name_255
 
-    def test_invalid_execution_mode_raises_error(self):
-        """Test that invalid execution mode raises error."""
-        with pytest.raises(ValidationError) as exc_info:
-            Snippet(name="test", content="test", execution_mode="invalid")
-        
-        assert "execution_mode" in str(exc_info.value)
-
     def test_valid_execution_modes(self):
         """Test that valid execution modes are accepted."""
         snippet1 = Snippet(name="test1", content="test", execution_mode="current")
@@ -179,9 +199,6 @@ class TestSnippetSerialization:
 
     def test_to_db_dict(self):
         """Test converting snippet to database dictionary."""
-        created = datetime(2024, 1, 1, 12, 0, 0)
-        updated = datetime(2024, 1, 2, 12, 0, 0)
-        
         snippet = Snippet(
             id="test-id",
             name="test-snippet",
@@ -191,28 +208,31 @@ class TestSnippetSerialization:
             execution_mode="isolated",
             gist_id="gist123",
             gist_url="https://gist.github.com/user/gist123",
-            created_at=created,
-            updated_at=updated,
+            created_at=_CREATED,
+            updated_at=_UPDATED,
         )
         
         db_dict = snippet.to_db_dict()
         
-        assert db_dict["id"] == "test-id"
-        assert db_dict["name"] == "test-snippet"
-        assert db_dict["content"] == "print('hello')"
-        assert db_dict["language"] == "python"
-        assert db_dict["tags"] == '["test", "example"]'
-        assert db_dict["execution_mode"] == "isolated"
-        assert db_dict["gist_id"] == "gist123"
-        assert db_dict["gist_url"] == "https://gist.github.com/user/gist123"
-        assert db_dict["created_at"] == created.isoformat()
-        assert db_dict["updated_at"] == updated.isoformat()
+        # Tags are compared decoded so the check doesn't depend on JSON spacing
+        assert json.loads(db_dict.pop("tags")) == ["test", "example"]
+        assert db_dict == {
+            "id": "test-id",
+            "name": "test-snippet",
+            "content": "print('hello')",
+            "language": "python",
+            "execution_mode": "isolated",
+            "gist_id": "gist123",
+            "gist_url": "https://gist.github.com/user/gist123",
+            "created_at": _CREATED_ISO,
+            "updated_at": _UPDATED_ISO,
+        }
 
     def test_to_db_dict_with_empty_tags(self):
         """Test converting snippet with empty tags."""
         snippet = Snippet(name="test", content="test", tags=[])
         db_dict = snippet.to_db_dict()
-        assert db_dict["tags"] == "[]"
+        assert json.loads(db_dict["tags"]) == []
 
     def test_to_db_dict_with_null_gist_fields(self):
         """Test converting snippet with null Gist fields."""
@@ -223,20 +243,7 @@ class TestSnippetSerialization:
 
     def test_from_db_dict(self):
         """Test creating snippet from database dictionary."""
-        db_dict = {
-            "id": "test-id",
-            "name": "test-snippet",
-            "content": "print('hello')",
-            "language": "python",
-            "tags": '["test", "example"]',
-            "execution_mode": "isolated",
-            "gist_id": "gist123",
-            "gist_url": "https://gist.github.com/user/gist123",
-            "created_at": "2024-01-01T12:00:00",
-            "updated_at": "2024-01-02T12:00:00",
-        }
-        
-        snippet = Snippet.from_db_dict(db_dict)
+        snippet = Snippet.from_db_dict(_BASE_DB_DICT)
         
         assert snippet.id == "test-id"
         assert snippet.name == "test-snippet"
@@ -246,48 +253,23 @@ class TestSnippetSerialization:
         assert snippet.execution_mode == "isolated"
         assert snippet.gist_id == "gist123"
         assert snippet.gist_url == "https://gist.github.com/user/gist123"
-        assert snippet.created_at == datetime(2024, 1, 1, 12, 0, 0)
-        assert snippet.updated_at == datetime(2024, 1, 2, 12, 0, 0)
+        assert snippet.created_at == _CREATED
+        assert snippet.updated_at == _UPDATED
 
     def test_from_db_dict_with_empty_tags(self):
         """Test creating snippet from dict with empty tags."""
-        db_dict = {
-            "id": "test-id",
-            "name": "test",
-            "content": "test",
-            "language": "auto",
-            "tags": "[]",
-            "execution_mode": "current",
-            "gist_id": None,
-            "gist_url": None,
-            "created_at": "2024-01-01T12:00:00",
-            "updated_at": "2024-01-01T12:00:00",
-        }
-        
-        snippet = Snippet.from_db_dict(db_dict)
+        snippet = Snippet.from_db_dict({**_BASE_DB_DICT, "tags": "[]"})
         assert snippet.tags == []
 
     def test_from_db_dict_with_null_tags(self):
         """Test creating snippet from dict with null tags."""
-        db_dict = {
-            "id": "test-id",
-            "name": "test",
-            "content": "test",
-            "language": "auto",
-            "tags": None,
-            "execution_mode": "current",
-            "gist_id": None,
-            "gist_url": None,
-            "created_at": "2024-01-01T12:00:00",
-            "updated_at": "2024-01-01T12:00:00",
-        }
-        
-        snippet = Snippet.from_db_dict(db_dict)
+        snippet = Snippet.from_db_dict({**_BASE_DB_DICT, "tags": None})
         assert snippet.tags == []
 
     def test_roundtrip_serialization(self):
         """Test that snippet can be serialized and deserialized."""
-        original = Snippet(
+        # Inputs are already valid, so skip validation on the way in
+        original = Snippet.model_construct(
             name="test",
             content="print('test')",
             language="python",
@@ -309,69 +291,12 @@ class TestSnippetSerialization:
 class TestSnippetFileExtension:
     """Test file extension detection."""
 
-    def test_get_python_extension(self):
-        """Test getting .py extension for Python."""
-        snippet = Snippet(name="test", content="test", language="python")
-        assert snippet.get_file_extension() == ".py"
-
-    def test_get_bash_extension(self):
-        """Test getting .sh extension for bash."""
-        snippet = Snippet(name="test", content="test", language="bash")
-        assert snippet.get_file_extension() == ".sh"
-
-    def test_get_shell_extension(self):
-        """Test getting .sh extension for shell."""
-        snippet = Snippet(name="test", content="test", language="shell")
-        assert snippet.get_file_extension() == ".sh"
-
-    def test_get_javascript_extension(self):
-        """Test getting .js extension for JavaScript."""
-        snippet = Snippet(name="test", content="test", language="javascript")
-        assert snippet.get_file_extension() == ".js"
-
-    def test_get_typescript_extension(self):
-        """Test getting .ts extension for TypeScript."""
-        snippet = Snippet(name="test", content="test", language="typescript")
-        assert snippet.get_file_extension() == ".ts"
-
-    def test_get_ruby_extension(self):
-        """Test getting .rb extension for Ruby."""
-        snippet = Snippet(name="test", content="test", language="ruby")
-        assert snippet.get_file_extension() == ".rb"
-
-    def test_get_go_extension(self):
-        """Test getting .go extension for Go."""
-        snippet = Snippet(name="test", content="test", language="go")
-        assert snippet.get_file_extension() == ".go"
-
-    def test_get_rust_extension(self):
-        """Test getting .rs extension for Rust."""
-        snippet = Snippet(name="test", content="test", language="rust")
-        assert snippet.get_file_extension() == ".rs"
-
-    def test_get_extension_case_insensitive(self):
-        """Test that language detection is case-insensitive."""
-        snippet1 = Snippet(name="test", content="test", language="Python")
-        snippet2 = Snippet(name="test", content="test", language="PYTHON")
-        
-        assert snippet1.get_file_extension() == ".py"
-        assert snippet2.get_file_extension() == ".py"
-
-    def test_get_unknown_extension_returns_txt(self):
-        """Test that unknown languages return .txt."""
-        snippet = Snippet(name="test", content="test", language="unknown")
-        assert snippet.get_file_extension() == ".txt"
-
-    def test_get_auto_extension_returns_txt(self):
-        """Test that 'auto' language returns .txt."""
-        snippet = Snippet(name="test", content="test", language="auto")
-        assert snippet.get_file_extension() == ".txt"
-
-    def test_all_supported_extensions(self):
-        """Test all supported file extensions."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "language, expected_ext",
+        [
             ("python", ".py"),
             ("bash", ".sh"),
+            ("shell", ".sh"),
             ("javascript", ".js"),
             ("typescript", ".ts"),
             ("ruby", ".rb"),
@@ -388,12 +313,18 @@ class TestSnippetFileExtension:
             ("json", ".json"),
             ("yaml", ".yaml"),
             ("markdown", ".md"),
-        ]
-        
-        for language, expected_ext in test_cases:
-            snippet = Snippet(name="test", content="test", language=language)
-            assert snippet.get_file_extension() == expected_ext, \
-                f"Language {language} should have extension {expected_ext}"
+            # Language detection is case-insensitive
+            ("Python", ".py"),
+            ("PYTHON", ".py"),
+            # Unknown languages and 'auto' fall back to .txt
+            ("unknown", ".txt"),
+            ("auto", ".txt"),
+        ],
+    )
+    def test_get_file_extension(self, base_snippet, language, expected_ext):
+        """Test the file extension for each language."""
+        snippet = base_snippet.model_copy(update={"language": language})
+        assert snippet.get_file_extension() == expected_ext
 
 
 class TestSnippetEdgeCases:
@@ -451,9 +382,8 @@ if __name__ == "__main__":
         
         assert snippet.name == "test-snippet_v1.0"
 
-    def test_snippet_with_very_long_content(self):
+    def test_snippet_with_very_long_content(self, long_content):
         """Test snippet with very long content."""
-        long_content = "x" * 100000
         snippet = Snippet(name="long", content=long_content)
         
         assert len(snippet.content) == 100000
@@ -1,120 +1,98 @@
 """Tests for the SnippetRunner."""
 
 import os
-import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
 from fredo.core.models import Snippet
 from fredo.core.runner import SnippetRunner
+from fredo.core.runner import runner as global_runner
 
+_LANGS = list(SnippetRunner.EXECUTORS)
 
-class TestLanguageDetection:
-    """Test language detection."""
-
-    def test_detect_explicit_python_language(self):
-        """Test detecting explicitly set Python language."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content="print('hello')",
-            language="python",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "python"
 
-    def test_detect_explicit_bash_language(self):
-        """Test detecting explicitly set bash language."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='echo "hello"',
-            language="bash",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "bash"
-
-    def test_detect_language_from_python_shebang(self):
-        """Test detecting language from Python shebang."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='#!/usr/bin/env python3\nprint("hello")',
-            language="auto",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "python"
+@pytest.fixture
+def fake_run(monkeypatch) -> list:
+    """Stub subprocess.run in the runner and record each call.
 
-    def test_detect_language_from_bash_shebang(self):
-        """Test detecting language from bash shebang."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='#!/bin/bash\necho "hello"',
-            language="auto",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "bash"
+    Every call records the command, the keyword arguments and the script
+    file's mode and content as they were when the command would have run.
+    """
+    calls = []
 
-    def test_detect_language_from_node_shebang(self):
-        """Test detecting language from node shebang."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='#!/usr/bin/env node\nconsole.log("hello")',
-            language="auto",
+    def run(cmd, **kwargs):
+        script = Path(cmd[-1])
+        calls.append(
+            SimpleNamespace(
+                cmd=cmd,
+                kwargs=kwargs,
+                mode=script.stat().st_mode & 0o777,
+                content=script.read_text(),
+            )
         )
-        
-        result = runner.detect_language(snippet)
-        assert result == "javascript"
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok\n", stderr="")
 
-    def test_detect_language_from_ruby_shebang(self):
-        """Test detecting language from ruby shebang."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='#!/usr/bin/env ruby\nputs "hello"',
-            language="auto",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "ruby"
+    monkeypatch.setattr("fredo.core.runner.subprocess.run", run)
+    monkeypatch.setattr(
+        "fredo.core.runner.shutil.which", lambda cmd: f"/usr/bin/{cmd}"
+    )
+    return calls
 
-    def test_detect_language_using_pygments_python(self):
-        """Test detecting Python using Pygments."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='import sys\ndef main():\n    print("hello")\n\nif __name__ == "__main__":\n    main()',
-            language="auto",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "python"
 
-    def test_detect_language_using_pygments_javascript(self):
-        """Test detecting JavaScript using Pygments."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test",
-            content='const x = 10;\nconsole.log(x);',
-            language="auto",
-        )
-        
-        result = runner.detect_language(snippet)
-        assert result == "javascript"
+class TestLanguageDetection:
+    """Test language detection."""
 
-    def test_detect_language_defaults_to_bash(self):
+    @pytest.mark.parametrize(
+        "language,expected",
+        [("python", "python"), ("bash", "bash")],
+        ids=["python", "bash"],
+    )
+    def test_detect_explicit_language(self, runner, language, expected):
+        """Test detecting an explicitly set language."""
+        snippet = Snippet(name="test", content="test", language=language)
+        
+        assert runner.detect_language(snippet) == expected
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ('#!/usr/bin/env python3\nprint("hello")', "python"),
+            ('#!/bin/bash\necho "hello"', "bash"),
+            ('#!/usr/bin/env node\nconsole.log("hello")', "javascript"),
+            ('#!/usr/bin/env ruby\nputs "hello"', "ruby"),
+        ],
+        ids=["python", "bash", "node", "ruby"],
+    )
+    def test_detect_language_from_shebang(self, runner, content, expected):
+        """Test detecting language from the shebang line."""
+        snippet = Snippet(name="test", content=content, language="auto")
+        
+        assert runner.detect_language(snippet) == expected
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (
+                'import sys\ndef main():\n    print("hello")\n\n'
+                'if __name__ == "__main__":\n    main()',
+                "python",
+            ),
+            ("const x = 10;\nconsole.log(x);", "javascript"),
+        ],
+        ids=["python", "javascript"],
+    )
+    def test_detect_language_from_content(self, runner, content, expected):
+        """Test detecting language from content without a shebang."""
+        snippet = Snippet(name="test", content=content, language="auto")
+        
+        assert runner.detect_language(snippet) == expected
+
+    def test_detect_language_defaults_to_bash(self, runner):
         """Test that unknown language defaults to bash."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content='some unknown content',
@@ -124,9 +102,8 @@ class TestLanguageDetection:
         result = runner.detect_language(snippet)
         assert result == "bash"
 
-    def test_detect_language_case_insensitive(self):
+    def test_detect_language_case_insensitive(self, runner):
         """Test that language detection is case-insensitive."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content="test",
@@ -136,68 +113,146 @@ class TestLanguageDetection:
         result = runner.detect_language(snippet)
         assert result == "python"
 
+    def test_detect_language_caches_pygments_guess(self, monkeypatch):
+        """Test that Pygments is consulted once for repeated content."""
+        guess = Mock(return_value=SimpleNamespace(name="Ruby"))
+        monkeypatch.setattr("fredo.core.runner.guess_lexer", guess)
+        runner = SnippetRunner()
+        snippet = Snippet(name="test", content="x = 1", language="auto")
+        
+        assert runner.detect_language(snippet) == "ruby"
+        assert runner.detect_language(snippet.model_copy()) == "ruby"
+        
+        guess.assert_called_once_with("x = 1")
+
 
 class TestCanExecute:
     """Test can_execute checks."""
 
-    def test_can_execute_supported_language_with_available_command(self):
+    def test_can_execute_supported_language_with_available_command(
+        self, runner, monkeypatch
+    ):
         """Test can_execute for supported language with available command."""
-        runner = SnippetRunner()
+        monkeypatch.setattr(
+            "fredo.core.runner.shutil.which", lambda cmd: "/usr/bin/python3"
+        )
         
-        # Python3 should be available on most systems
-        with patch("shutil.which", return_value="/usr/bin/python3"):
-            can_exec, error = runner.can_execute("python")
+        can_exec, error = runner.can_execute("python")
         
         assert can_exec is True
         assert error is None
 
-    def test_can_execute_supported_language_without_command(self):
+    def test_can_execute_supported_language_without_command(
+        self, runner, monkeypatch
+    ):
         """Test can_execute for supported language without available command."""
-        runner = SnippetRunner()
+        monkeypatch.setattr("fredo.core.runner.shutil.which", lambda cmd: None)
         
-        with patch("shutil.which", return_value=None):
-            can_exec, error = runner.can_execute("python")
+        can_exec, error = runner.can_execute("python")
         
         assert can_exec is False
         assert "not found" in error
 
-    def test_can_execute_unsupported_language(self):
+    def test_can_execute_unsupported_language(self, runner):
         """Test can_execute for unsupported language."""
-        runner = SnippetRunner()
-        
         can_exec, error = runner.can_execute("unsupported")
         
         assert can_exec is False
         assert "Unsupported language" in error
 
-    def test_can_execute_case_insensitive(self):
+    def test_can_execute_case_insensitive(self, runner, monkeypatch):
         """Test that can_execute is case-insensitive."""
-        runner = SnippetRunner()
+        monkeypatch.setattr(
+            "fredo.core.runner.shutil.which", lambda cmd: "/usr/bin/python3"
+        )
         
-        with patch("shutil.which", return_value="/usr/bin/python3"):
-            can_exec, error = runner.can_execute("PYTHON")
+        can_exec, error = runner.can_execute("PYTHON")
         
         assert can_exec is True
 
-    def test_can_execute_all_supported_languages(self):
-        """Test can_execute for all supported languages."""
-        runner = SnippetRunner()
+    @pytest.mark.parametrize("lang", _LANGS)
+    def test_can_execute_all_supported_languages(self, runner, monkeypatch, lang):
+        """Test can_execute for every supported language."""
+        monkeypatch.setattr(
+            "fredo.core.runner.shutil.which", lambda cmd: f"/usr/bin/{cmd}"
+        )
         
-        supported_languages = list(runner.EXECUTORS.keys())
+        can_exec, error = runner.can_execute(lang)
         
-        for lang in supported_languages:
-            # Mock the command as available
-            with patch("shutil.which", return_value=f"/usr/bin/{lang}"):
-                can_exec, error = runner.can_execute(lang)
-                assert can_exec is True, f"Language {lang} should be executable"
+        assert can_exec is True, f"Language {lang} should be executable"
+        assert error is None
+
+
+class TestSnippetRunCommand:
+    """Test the command the runner builds, without spawning it."""
+
+    @pytest.mark.parametrize(
+        "language,executable,suffix",
+        [
+            ("python", "python3", ".py"),
+            ("bash", "bash", ".sh"),
+            ("javascript", "node", ".js"),
+            ("ruby", "ruby", ".rb"),
+        ],
+        ids=["python", "bash", "javascript", "ruby"],
+    )
+    def test_run_builds_command_for_language(
+        self, runner, fake_run, tmp_path, language, executable, suffix
+    ):
+        """Test that run invokes the executor on a temp file with the right suffix."""
+        snippet = Snippet(name="test", content="body", language=language)
+        
+        result = runner.run(snippet, cwd=str(tmp_path))
+        
+        assert result.stdout == "ok\n"
+        (call,) = fake_run
+        assert call.cmd[0] == executable
+        script = Path(call.cmd[-1])
+        assert script.parent == tmp_path
+        assert script.suffix == suffix
+        assert call.content == "body"
+        assert call.kwargs["cwd"] == str(tmp_path)
+
+    @pytest.mark.parametrize(
+        "language,mode",
+        [("bash", 0o755), ("sh", 0o755), ("python", 0o600)],
+        ids=["bash", "sh", "python"],
+    )
+    def test_run_makes_only_shell_scripts_executable(
+        self, runner, fake_run, tmp_path, language, mode
+    ):
+        """Test that only shell scripts are chmodded before running."""
+        snippet = Snippet(name="test", content="body", language=language)
+        
+        runner.run(snippet, cwd=str(tmp_path))
+        
+        assert fake_run[0].mode == mode
+
+    def test_run_removes_temp_file_after_running(self, runner, fake_run, tmp_path):
+        """Test that the snippet file is removed once the command returns."""
+        snippet = Snippet(name="test", content="body", language="python")
+        
+        runner.run(snippet, cwd=str(tmp_path))
+        
+        assert not Path(fake_run[0].cmd[-1]).exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_runner_passes_text_true(self, runner, fake_run, tmp_path):
+        """Test that output is decoded by subprocess rather than returned as bytes."""
+        snippet = Snippet(name="test", content="body", language="python")
+        
+        runner.run(snippet, cwd=str(tmp_path))
+        
+        assert fake_run[0].kwargs["text"] is True
+        assert fake_run[0].kwargs["capture_output"] is True
 
 
 class TestSnippetExecution:
     """Test snippet execution."""
 
-    def test_run_python_snippet_success(self):
+    @pytest.mark.integration
+    def test_run_python_snippet_success(self, runner, available_cmds, tmp_path):
         """Test running a successful Python snippet."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-python",
             content='print("Hello from Python")',
@@ -206,17 +261,17 @@ class TestSnippetExecution:
         )
         
         # Only run if python3 is available
-        if not shutil.which("python3"):
+        if not available_cmds["python3"]:
             pytest.skip("python3 not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 0
         assert "Hello from Python" in result.stdout
 
-    def test_run_bash_snippet_success(self):
+    @pytest.mark.integration
+    def test_run_bash_snippet_success(self, runner, available_cmds, tmp_path):
         """Test running a successful bash snippet."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-bash",
             content='echo "Hello from Bash"',
@@ -225,17 +280,17 @@ class TestSnippetExecution:
         )
         
         # Only run if bash is available
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 0
         assert "Hello from Bash" in result.stdout
 
-    def test_run_snippet_with_error(self):
+    @pytest.mark.integration
+    def test_run_snippet_with_error(self, runner, available_cmds, tmp_path):
         """Test running a snippet that produces an error."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-error",
             content='exit 1',
@@ -243,16 +298,15 @@ class TestSnippetExecution:
             execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 1
 
-    def test_run_unsupported_language_raises_error(self):
+    def test_run_unsupported_language_raises_error(self, runner):
         """Test that running unsupported language raises error."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content="test",
@@ -264,9 +318,8 @@ class TestSnippetExecution:
         
         assert "Unsupported language" in str(exc_info.value)
 
-    def test_run_unavailable_command_raises_error(self):
+    def test_run_unavailable_command_raises_error(self, runner, monkeypatch):
         """Test that running with unavailable command raises error."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content="test",
@@ -274,36 +327,34 @@ class TestSnippetExecution:
         )
         
         # Mock rust-script as not available
-        with patch("shutil.which", return_value=None):
-            with pytest.raises(RuntimeError) as exc_info:
-                runner.run(snippet)
-            
-            assert "not found" in str(exc_info.value)
+        monkeypatch.setattr("fredo.core.runner.shutil.which", lambda cmd: None)
+        with pytest.raises(RuntimeError) as exc_info:
+            runner.run(snippet)
+        
+        assert "not found" in str(exc_info.value)
 
-    def test_run_with_custom_cwd(self):
+    @pytest.mark.integration
+    def test_run_with_custom_cwd(self, runner, available_cmds, tmp_path):
         """Test running snippet with custom working directory."""
-        runner = SnippetRunner()
+        snippet = Snippet(
+            name="test-cwd",
+            content='echo "test" > output.txt',
+            language="bash",
+            execution_mode="current",
+        )
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            snippet = Snippet(
-                name="test-cwd",
-                content='echo "test" > output.txt',
-                language="bash",
-                execution_mode="current",
-            )
-            
-            if not shutil.which("bash"):
-                pytest.skip("bash not available")
-            
-            runner.run(snippet, cwd=temp_dir)
-            
-            # Check that file was created in the custom cwd
-            output_file = Path(temp_dir) / "output.txt"
-            assert output_file.exists()
-
-    def test_run_isolated_mode_creates_temp_dir(self):
-        """Test that isolated mode creates temporary directory."""
-        runner = SnippetRunner()
+        if not available_cmds["bash"]:
+            pytest.skip("bash not available")
+        
+        runner.run(snippet, cwd=tmp_path)
+        
+        # Check that file was created in the custom cwd
+        output_file = tmp_path / "output.txt"
+        assert output_file.exists()
+
+    @pytest.mark.integration
+    def test_run_isolated_mode(self, runner, available_cmds):
+        """Test that isolated mode runs in a temp dir and removes it afterwards."""
         snippet = Snippet(
             name="test-isolated",
             content='pwd',
@@ -311,100 +362,59 @@ class TestSnippetExecution:
             execution_mode="isolated",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
         original_cwd = os.getcwd()
         result = runner.run(snippet)
+        temp_dir = result.stdout.strip()
         
-        # Should have run in a different directory
+        # Should have run in a fresh directory that is gone afterwards
         assert result.returncode == 0
-        assert "fredo_" in result.stdout
+        assert "fredo_" in temp_dir
+        assert not os.path.exists(temp_dir)
         
         # Current directory should be unchanged
         assert os.getcwd() == original_cwd
 
-    def test_run_isolated_mode_cleans_up_temp_dir(self):
-        """Test that isolated mode cleans up temporary directory."""
-        runner = SnippetRunner()
+    @pytest.mark.integration
+    def test_run_current_mode_uses_provided_cwd(self, runner, available_cmds, tmp_path):
+        """Test that current mode uses provided cwd."""
         snippet = Snippet(
-            name="test-cleanup",
+            name="test-current",
             content='pwd',
             language="bash",
-            execution_mode="isolated",
+            execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet)
-        temp_dir = result.stdout.strip()
+        result = runner.run(snippet, cwd=tmp_path)
         
-        # Directory should not exist after execution
-        # (cleanup happens even if temp_dir path is in output)
-        # We can't directly check since the cleanup is best-effort
         assert result.returncode == 0
+        assert str(tmp_path) in result.stdout
 
-    def test_run_current_mode_uses_provided_cwd(self):
-        """Test that current mode uses provided cwd."""
-        runner = SnippetRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            snippet = Snippet(
-                name="test-current",
-                content='pwd',
-                language="bash",
-                execution_mode="current",
-            )
-            
-            if not shutil.which("bash"):
-                pytest.skip("bash not available")
-            
-            result = runner.run(snippet, cwd=temp_dir)
-            
-            assert result.returncode == 0
-            assert temp_dir in result.stdout
-
-    def test_run_creates_temp_file_with_correct_extension(self):
-        """Test that temporary files have correct extension."""
-        runner = SnippetRunner()
+    @pytest.mark.integration
+    def test_run_makes_shell_scripts_executable(self, runner, available_cmds, tmp_path):
+        """Test that shell scripts are made executable."""
         snippet = Snippet(
-            name="test-ext",
-            content='import sys; print(sys.argv[0])',
-            language="python",
+            name="test-executable",
+            content='#!/bin/bash\necho "executable"',
+            language="bash",
             execution_mode="current",
         )
         
-        if not shutil.which("python3"):
-            pytest.skip("python3 not available")
-        
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        if not available_cmds["bash"]:
+            pytest.skip("bash not available")
         
+        # This test verifies the file is executable by successfully running it
+        result = runner.run(snippet, cwd=tmp_path)
         assert result.returncode == 0
-        assert ".py" in result.stdout
 
-    def test_run_makes_shell_scripts_executable(self):
-        """Test that shell scripts are made executable."""
-        runner = SnippetRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            snippet = Snippet(
-                name="test-executable",
-                content='#!/bin/bash\necho "executable"',
-                language="bash",
-                execution_mode="current",
-            )
-            
-            if not shutil.which("bash"):
-                pytest.skip("bash not available")
-            
-            # This test verifies the file is executable by successfully running it
-            result = runner.run(snippet, cwd=temp_dir)
-            assert result.returncode == 0
-
-    def test_run_cleans_up_temp_file(self):
+    @pytest.mark.integration
+    def test_run_cleans_up_temp_file(self, runner, available_cmds, tmp_path):
         """Test that temporary file is cleaned up after execution."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-cleanup-file",
             content='echo "test"',
@@ -412,22 +422,21 @@ class TestSnippetExecution:
             execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Count files before
-            files_before = list(Path(temp_dir).iterdir())
-            
-            runner.run(snippet, cwd=temp_dir)
-            
-            # Count files after - should be the same (temp file cleaned up)
-            files_after = list(Path(temp_dir).iterdir())
-            assert len(files_after) == len(files_before)
-
-    def test_run_with_capture_output_false(self):
+        # Count files before
+        files_before = list(tmp_path.iterdir())
+        
+        runner.run(snippet, cwd=tmp_path)
+        
+        # Count files after - should be the same (temp file cleaned up)
+        files_after = list(tmp_path.iterdir())
+        assert len(files_after) == len(files_before)
+
+    @pytest.mark.integration
+    def test_run_with_capture_output_false(self, runner, available_cmds, tmp_path):
         """Test running with capture_output=False."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-no-capture",
             content='echo "test"',
@@ -435,10 +444,10 @@ class TestSnippetExecution:
             execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir(), capture_output=False)
+        result = runner.run(snippet, cwd=tmp_path, capture_output=False)
         
         assert result.returncode == 0
         # Output should not be captured
@@ -449,9 +458,9 @@ class TestSnippetExecution:
 class TestSnippetRunnerEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_run_snippet_with_multiline_content(self):
+    @pytest.mark.integration
+    def test_run_snippet_with_multiline_content(self, runner, available_cmds, tmp_path):
         """Test running snippet with multiline content."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-multiline",
             content='''#!/bin/bash
@@ -462,37 +471,50 @@ echo "Line 3"''',
             execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 0
         assert "Line 1" in result.stdout
         assert "Line 2" in result.stdout
         assert "Line 3" in result.stdout
 
-    def test_run_snippet_with_unicode_content(self):
-        """Test running snippet with Unicode content."""
-        runner = SnippetRunner()
+    @pytest.mark.integration
+    def test_run_python_compound(self, runner, available_cmds, tmp_path):
+        """Test file extension, Unicode and long output with one Python run."""
         snippet = Snippet(
-            name="test-unicode",
-            content='print("Hello 世界 🌍")',
+            name="test-python-compound",
+            content=(
+                "import sys\n"
+                "print('argv:', sys.argv[0])\n"
+                "print('unicode: Hello 世界 🌍')\n"
+                "print('long:')\n"
+                "for i in range(100):\n"
+                "    print(i)\n"
+            ),
             language="python",
             execution_mode="current",
         )
         
-        if not shutil.which("python3"):
+        if not available_cmds["python3"]:
             pytest.skip("python3 not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 0
-        assert "Hello" in result.stdout
-
-    def test_run_snippet_with_special_characters(self):
+        lines = result.stdout.splitlines()
+        assert lines[0].startswith("argv:") and lines[0].endswith(".py")
+        assert "Hello" in lines[1]
+        assert lines[2] == "long:"
+        assert lines[3:] == [str(i) for i in range(100)]
+
+    @pytest.mark.integration
+    def test_run_snippet_with_special_characters(
+        self, runner, available_cmds, tmp_path
+    ):
         """Test running snippet with special characters."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test-special",
             content='echo "Special: $HOME & < > | \'"',
@@ -500,10 +522,10 @@ echo "Line 3"''',
             execution_mode="current",
         )
         
-        if not shutil.which("bash"):
+        if not available_cmds["bash"]:
             pytest.skip("bash not available")
         
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
+        result = runner.run(snippet, cwd=tmp_path)
         
         assert result.returncode == 0
         assert "Special:" in result.stdout
@@ -516,9 +538,8 @@ echo "Line 3"''',
         with pytest.raises(ValidationError):
             Snippet(name="empty", content="", language="python")
 
-    def test_detect_language_with_empty_shebang_line(self):
+    def test_detect_language_with_empty_shebang_line(self, runner):
         """Test detecting language with empty first line."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content='\nprint("hello")',
@@ -529,9 +550,8 @@ echo "Line 3"''',
         result = runner.detect_language(snippet)
         assert result == "python"
 
-    def test_detect_language_with_comment_before_shebang(self):
+    def test_detect_language_with_comment_before_shebang(self, runner):
         """Test that shebang must be first line."""
-        runner = SnippetRunner()
         snippet = Snippet(
             name="test",
             content='# comment\n#!/usr/bin/env python3\nprint("hello")',
@@ -542,33 +562,15 @@ echo "Line 3"''',
         result = runner.detect_language(snippet)
         assert result == "python"  # Pygments should detect it
 
-    def test_run_snippet_with_very_long_output(self):
-        """Test running snippet that produces very long output."""
-        runner = SnippetRunner()
-        snippet = Snippet(
-            name="test-long-output",
-            content='for i in range(1000):\n    print(i)',
-            language="python",
-            execution_mode="current",
-        )
-        
-        if not shutil.which("python3"):
-            pytest.skip("python3 not available")
-        
-        result = runner.run(snippet, cwd=tempfile.gettempdir())
-        
-        assert result.returncode == 0
-        assert "999" in result.stdout
-
-    def test_executor_mapping_all_languages(self):
-        """Test that all languages in EXECUTORS have valid configuration."""
-        runner = SnippetRunner()
+    @pytest.mark.parametrize("lang", _LANGS)
+    def test_executor_mapping_all_languages(self, lang):
+        """Test that every language in EXECUTORS has a valid configuration."""
+        config = SnippetRunner.EXECUTORS[lang]
         
-        for lang, config in runner.EXECUTORS.items():
-            assert "cmd" in config
-            assert isinstance(config["cmd"], list)
-            assert len(config["cmd"]) > 0
-            assert "use_file" in config
+        assert "cmd" in config
+        assert isinstance(config["cmd"], list)
+        assert len(config["cmd"]) > 0
+        assert "use_file" in config
 
 
 class TestSnippetRunnerGlobalInstance:
@@ -576,23 +578,20 @@ class TestSnippetRunnerGlobalInstance:
 
     def test_global_runner_instance_exists(self):
         """Test that global runner instance is available."""
-        from fredo.core.runner import runner
-        
-        assert runner is not None
-        assert isinstance(runner, SnippetRunner)
+        assert global_runner is not None
+        assert isinstance(global_runner, SnippetRunner)
 
-    def test_global_runner_is_functional(self):
+    @pytest.mark.integration
+    def test_global_runner_is_functional(self, tmp_path):
         """Test that global runner instance works."""
-        from fredo.core.runner import runner
-        
         snippet = Snippet(
             name="test",
             content='echo "test"',
             language="bash",
         )
         
-        can_exec, _ = runner.can_execute("bash")
+        can_exec, _ = global_runner.can_execute("bash")
         if can_exec:
-            result = runner.run(snippet, cwd=tempfile.gettempdir())
+            result = global_runner.run(snippet, cwd=tmp_path)
             assert result.returncode == 0
 
@@ -26,6 +26,14 @@ class TestSearchResult:
         assert sample_snippet.name in repr_str
         assert "85" in repr_str
 
+    def test_search_result_uses_slots(self, sample_snippet: Snippet):
+        """Test that search results carry no per-instance __dict__."""
+        result = SearchResult(sample_snippet, 85)
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = "value"
+
 
 class TestSearchBasic:
     """Test basic search functionality."""
@@ -323,6 +331,17 @@ class TestSearchLimit:
         
         assert len(results) == 0
 
+    def test_search_with_limit_zero_skips_database(self, db: Database, monkeypatch):
+        """Test that a limit of zero returns without querying the database."""
+        def fail_search(**kwargs):
+            raise AssertionError("database should not be queried")
+        
+        monkeypatch.setattr(db, "search", fail_search)
+        
+        engine = SearchEngine(database=db)
+        
+        assert engine.search(query="docker", limit=0) == []
+
     def test_search_query_with_limit(self, db: Database, multiple_snippets):
         """Test query search with limit."""
         for snippet in multiple_snippets:
@@ -335,6 +354,52 @@ class TestSearchLimit:
         # Should return the highest scoring match
         assert "python" in results[0].snippet.name
 
+    def test_search_query_limit_matches_full_ranking(self, db: Database):
+        """Test that a limited query returns the head of the full ranking."""
+        for i in range(20):
+            content = "docker " * (i % 4 + 1)
+            db.create(Snippet(name=f"snippet-{i}", content=content))
+        
+        engine = SearchEngine(database=db)
+        ranked = engine.search(query="docker")
+        limited = engine.search(query="docker", limit=3)
+        
+        assert [r.snippet.id for r in limited] == [
+            r.snippet.id for r in ranked[:3]
+        ]
+
+
+class TestSearchRank:
+    """Test ranking snippets the caller already holds."""
+
+    def test_rank_scores_given_snippets(
+        self, db: Database, multiple_snippets, monkeypatch
+    ):
+        """Test that rank scores the given list without querying the database."""
+        def fail_search(**kwargs):
+            raise AssertionError("database should not be queried")
+        
+        monkeypatch.setattr(db, "search", fail_search)
+        
+        engine = SearchEngine(database=db)
+        results = engine.rank("python", multiple_snippets, limit=1)
+        
+        assert len(results) == 1
+        assert results[0].snippet.name.startswith("python-")
+
+    def test_rank_matches_search(self, db: Database, multiple_snippets):
+        """Test that rank orders snippets the same way search does."""
+        for snippet in multiple_snippets:
+            db.create(snippet)
+        
+        engine = SearchEngine(database=db)
+        searched = engine.search(query="hello")
+        ranked = engine.rank("hello", db.search())
+        
+        assert [(r.snippet.id, r.score) for r in ranked] == [
+            (r.snippet.id, r.score) for r in searched
+        ]
+
 
 class TestSearchEdgeCases:
     """Test edge cases and boundary conditions."""